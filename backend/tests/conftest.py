@@ -0,0 +1,9 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+VENDOR = ROOT / 'vendor'
+
+value = str(VENDOR)
+if value not in sys.path:
+    sys.path.insert(0, value)
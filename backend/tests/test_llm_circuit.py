@@ -0,0 +1,41 @@
+import pytest
+
+engine = pytest.importorskip('videolingo_subtitle_core.engine')
+
+KEY = ('http://llm.invalid', 'test', 'chat', 'digest')
+
+
+@pytest.fixture(autouse=True)
+def _clean_circuit(monkeypatch):
+    monkeypatch.setattr(engine, '_LLM_CIRCUIT_FAILURES', {})
+    monkeypatch.setattr(engine, '_LLM_CIRCUIT_TRIPPED_AT', {})
+    monkeypatch.setattr(engine, '_LLM_CIRCUIT_INFLIGHT', {})
+
+
+def _age_circuit():
+    engine._LLM_CIRCUIT_TRIPPED_AT[KEY] -= engine._LLM_CIRCUIT_OPEN_SECONDS + 1
+
+
+def test_circuit_allows_single_half_open_probe():
+    assert engine._llm_circuit_allow(KEY) == (True, False)
+    for _ in range(engine._LLM_CIRCUIT_FAIL_THRESHOLD):
+        engine._llm_circuit_record_failure(KEY)
+    assert engine._llm_circuit_allow(KEY) == (False, False)
+
+    _age_circuit()
+    assert engine._llm_circuit_allow(KEY) == (True, True)
+    assert engine._llm_circuit_allow(KEY) == (False, False)
+
+
+def test_closed_state_call_does_not_free_probe_slot():
+    for _ in range(engine._LLM_CIRCUIT_FAIL_THRESHOLD):
+        engine._llm_circuit_record_failure(KEY)
+    _age_circuit()
+    assert engine._llm_circuit_allow(KEY) == (True, True)
+
+    engine._llm_circuit_record_failure(KEY)
+    _age_circuit()
+    assert engine._llm_circuit_allow(KEY) == (False, False)
+
+    engine._llm_circuit_release_probe(KEY)
+    assert engine._llm_circuit_allow(KEY) == (True, True)
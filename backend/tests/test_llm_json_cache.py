@@ -0,0 +1,79 @@
+from collections import OrderedDict
+
+import pytest
+
+engine = pytest.importorskip('videolingo_subtitle_core.engine')
+
+LLM_OPTS = engine.LlmOptions(base_url='http://llm.invalid', api_key='', model='test', llm_support_json=True)
+
+
+def _align():
+    return engine._align_translation_parts_with_llm(
+        source_text='one two',
+        translation='一二',
+        source_parts=['one', 'two'],
+        llm_opts=LLM_OPTS,
+    )
+
+
+def test_invalid_reply_is_not_cached(monkeypatch):
+    monkeypatch.setattr(engine, '_LLM_JSON_CACHE', OrderedDict())
+    replies = [{'parts': ['一二']}, {'parts': ['一', '二']}]
+    calls = []
+
+    def fake_chat_json(opts, prompt):
+        calls.append(prompt)
+        return replies[min(len(calls), len(replies)) - 1]
+
+    monkeypatch.setattr(engine, '_chat_json', fake_chat_json)
+    with pytest.raises(engine.PipelineError) as excinfo:
+        _align()
+    assert excinfo.value.code == 'subtitle_split_align_invalid'
+    assert _align() == ['一', '二']
+    assert _align() == ['一', '二']
+    assert len(calls) == 2
+
+
+def test_concurrent_replies_cached_only_when_valid(monkeypatch):
+    monkeypatch.setattr(engine, '_LLM_JSON_CACHE', OrderedDict())
+    calls = []
+
+    def fake_chat_json(opts, prompt):
+        calls.append(prompt)
+        return {'id_0': prompt if prompt == 'good' else ''}
+
+    def validate(index, data):
+        return bool(data.get('id_0'))
+
+    monkeypatch.setattr(engine, '_chat_json', fake_chat_json)
+    for _ in range(2):
+        results = sorted(engine._iter_chat_json_concurrent(LLM_OPTS, ['good', 'bad'], validate=validate))
+        assert [data for _, data, _ in results] == [{'id_0': 'good'}, {'id_0': ''}]
+    assert sorted(calls) == ['bad', 'bad', 'good']
+
+
+def test_cache_hits_skip_concurrency_accounting(monkeypatch):
+    monkeypatch.setattr(engine, '_LLM_JSON_CACHE', OrderedDict())
+    monkeypatch.setattr(engine, '_LLM_CONCURRENCY_CONTROLLERS', {})
+    monkeypatch.setattr(engine, '_chat_json', lambda opts, prompt: {'id_0': prompt})
+    prompts = ['a', 'b', 'c']
+
+    list(engine._iter_chat_json_concurrent(LLM_OPTS, prompts, validate=lambda index, data: True))
+    controller = engine._get_llm_concurrency_controller('http://llm.invalid', 'test')
+    state = (controller._limit, controller._latency_ewma)
+
+    def fail_chat_json(opts, prompt):
+        raise AssertionError(prompt)
+
+    monkeypatch.setattr(engine, '_chat_json', fail_chat_json)
+    results = sorted(engine._iter_chat_json_concurrent(LLM_OPTS, prompts))
+    assert [data for _, data, _ in results] == [{'id_0': 'a'}, {'id_0': 'b'}, {'id_0': 'c'}]
+    assert (controller._limit, controller._latency_ewma) == state
+
+
+def test_concurrency_controller_is_per_endpoint_and_model(monkeypatch):
+    monkeypatch.setattr(engine, '_LLM_CONCURRENCY_CONTROLLERS', {})
+    first = engine._get_llm_concurrency_controller('http://a.invalid/', 'm1')
+    assert engine._get_llm_concurrency_controller('http://a.invalid', 'm1') is first
+    assert engine._get_llm_concurrency_controller('http://a.invalid', 'm2') is not first
+    assert engine._get_llm_concurrency_controller('http://b.invalid', 'm1') is not first
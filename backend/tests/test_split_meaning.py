@@ -0,0 +1,58 @@
+import random
+import sys
+from importlib import import_module
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+VL_FLOW_DIR = ROOT / 'vendor' / 'videolingo_subtitle_core' / 'vl_flow'
+
+if 'vl_flow' not in sys.modules:
+    spec = spec_from_file_location('vl_flow', VL_FLOW_DIR / '__init__.py', submodule_search_locations=[str(VL_FLOW_DIR)])
+    assert spec and spec.loader
+    sys.modules['vl_flow'] = module_from_spec(spec)
+    spec.loader.exec_module(sys.modules['vl_flow'])
+
+module = import_module('vl_flow.split_meaning')
+
+_remap_positions_to_original = module._remap_positions_to_original
+
+
+def _walk_remap(original, compact_positions):
+    if not compact_positions:
+        return []
+    mapping = []
+    compact_index = 0
+    for raw_index, char in enumerate(original):
+        if char.isspace():
+            continue
+        compact_index += 1
+        while compact_positions and compact_index == compact_positions[0]:
+            mapping.append(raw_index + 1)
+            compact_positions.pop(0)
+            if not compact_positions:
+                return mapping
+    return mapping
+
+
+def test_remap_positions_to_original():
+    assert _remap_positions_to_original('ab cd  ef', [2, 4, 6]) == [2, 5, 9]
+    assert _remap_positions_to_original('ab cd', [2, 9]) == [2]
+    assert _remap_positions_to_original('ab cd', [3, 1]) == [4]
+    assert _remap_positions_to_original('ab cd', []) == []
+
+
+def test_remap_positions_does_not_mutate_argument():
+    positions = [1, 3]
+    _remap_positions_to_original('a b c', positions)
+    assert positions == [1, 3]
+
+
+def test_remap_positions_matches_character_walk():
+    rng = random.Random(5)
+    for _ in range(5000):
+        original = ''.join(rng.choice('ab  \n\t') for _ in range(rng.randint(0, 40)))
+        positions = sorted(rng.randint(0, 30) for _ in range(rng.randint(0, 6)))
+        if rng.random() < 0.2:
+            rng.shuffle(positions)
+        assert _remap_positions_to_original(original, positions) == _walk_remap(original, list(positions))
@@ -0,0 +1,40 @@
+import sys
+from importlib import import_module
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+VL_FLOW_DIR = ROOT / 'vendor' / 'videolingo_subtitle_core' / 'vl_flow'
+
+if 'vl_flow' not in sys.modules:
+    spec = spec_from_file_location('vl_flow', VL_FLOW_DIR / '__init__.py', submodule_search_locations=[str(VL_FLOW_DIR)])
+    assert spec and spec.loader
+    sys.modules['vl_flow'] = module_from_spec(spec)
+    spec.loader.exec_module(sys.modules['vl_flow'])
+
+module = import_module('vl_flow.split_subtitles')
+
+_parse_split_source_payload = module._parse_split_source_payload
+
+TEXT = 'the dog ran back into the woods and then home'
+
+
+def test_parse_split_source_payload_exact_split():
+    payload = {'split': 'the dog ran back into the woods[br]and then home'}
+    assert _parse_split_source_payload(payload, TEXT) == ['the dog ran back into the woods', 'and then home']
+
+
+@pytest.mark.parametrize(
+    'split',
+    [
+        'the dog ran back into the old woods[br]and then home',
+        'the dog ran into the woods[br]and then home',
+        'the dog ran back in the woods[br]and then home',
+        'the big dog ran back into the woods[br]and then home',
+        'the dog ran back into the woods[br]and then back home',
+    ],
+)
+def test_parse_split_source_payload_perturbed_split(split):
+    assert _parse_split_source_payload({'split': split}, TEXT) == ['the dog ran back into the woods', 'and then home']
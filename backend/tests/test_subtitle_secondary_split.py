@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+engine = pytest.importorskip('videolingo_subtitle_core.engine')
+
+LLM_OPTS = engine.LlmOptions(base_url='http://llm.invalid', api_key='', model='test')
+
+
+def _fake_align(*, source_text, translation, source_parts, llm_opts, should_cancel=None):
+    words = str(translation or '').split()
+    size = max(1, -(-len(words) // len(source_parts)))
+    return [' '.join(words[idx * size:(idx + 1) * size]) for idx in range(len(source_parts))]
+
+
+def _fixed_point_split(rows):
+    current = [row for row in map(engine._normalize_subtitle_text_row, rows) if row is not None]
+    for _ in range(3):
+        changed = False
+        next_rows = []
+        for row in current:
+            text = row['text']
+            translation = row['translation']
+            if not engine._needs_subtitle_secondary_split(text, translation):
+                next_rows.append(row)
+                continue
+            source_parts = engine._rule_split_sentence_parts(text)
+            if len(source_parts) < 2:
+                next_rows.append(row)
+                continue
+            translation_parts = engine._align_translation_parts_with_llm(
+                source_text=text,
+                translation=translation,
+                source_parts=source_parts,
+                llm_opts=LLM_OPTS,
+            )
+            changed = True
+            for idx, part in enumerate(source_parts):
+                next_rows.append({
+                    'text': str(part).strip(),
+                    'translation': str(translation_parts[idx] if idx < len(translation_parts) else '').strip(),
+                })
+        current = [row for row in next_rows if row['text']]
+        if not changed:
+            break
+    return current
+
+
+def _random_text(rng, vocab, count):
+    words = [rng.choice(vocab) for _ in range(count)]
+    for idx in range(len(words) - 1):
+        if rng.random() < 0.1:
+            words[idx] += rng.choice([',', '.', '?'])
+    return ' '.join(words)
+
+
+def test_split_long_subtitle_rows_keeps_short_rows(monkeypatch):
+    monkeypatch.setattr(engine, '_align_translation_parts_with_llm', _fake_align)
+    rows = [{'text': ' hello there ', 'translation': '你好'}, {'text': '', 'translation': 'x'}]
+    assert engine._split_long_subtitle_rows(rows, LLM_OPTS) == [{'text': 'hello there', 'translation': '你好'}]
+
+
+def test_split_long_subtitle_rows_matches_fixed_point_loop(monkeypatch):
+    monkeypatch.setattr(engine, '_align_translation_parts_with_llm', _fake_align)
+    rng = random.Random(11)
+    vocab = ['the', 'subtitle', 'splitter', 'keeps', 'order', 'across', 'passes', 'a', 'extraordinarily']
+    for _ in range(300):
+        rows = [
+            {
+                'text': _random_text(rng, vocab, rng.randint(0, 60)),
+                'translation': _random_text(rng, vocab, rng.randint(0, 40)),
+            }
+            for _ in range(rng.randint(0, 8))
+        ]
+        assert engine._split_long_subtitle_rows(rows, LLM_OPTS) == _fixed_point_split(rows)
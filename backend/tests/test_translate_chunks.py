@@ -0,0 +1,59 @@
+import random
+import sys
+from importlib import import_module
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+VL_FLOW_DIR = ROOT / 'vendor' / 'videolingo_subtitle_core' / 'vl_flow'
+
+if 'vl_flow' not in sys.modules:
+    spec = spec_from_file_location('vl_flow', VL_FLOW_DIR / '__init__.py', submodule_search_locations=[str(VL_FLOW_DIR)])
+    assert spec and spec.loader
+    sys.modules['vl_flow'] = module_from_spec(spec)
+    spec.loader.exec_module(sys.modules['vl_flow'])
+
+module = import_module('vl_flow.translate_chunks')
+
+_split_chunks_by_chars = module._split_chunks_by_chars
+
+
+def _greedy_chunks(lines, *, chunk_size, max_lines):
+    if not lines:
+        return []
+    chunks = []
+    start = 0
+    cursor = 0
+    char_count = 0
+    line_count = 0
+    while cursor < len(lines):
+        line_chars = len(lines[cursor]) + 1
+        if line_count >= max(1, int(max_lines)) or (line_count > 0 and char_count + line_chars > max(1, int(chunk_size))):
+            chunks.append((start, cursor))
+            start = cursor
+            char_count = 0
+            line_count = 0
+            continue
+        char_count += line_chars
+        line_count += 1
+        cursor += 1
+    if start < len(lines):
+        chunks.append((start, len(lines)))
+    return chunks
+
+
+def test_split_chunks_by_chars_limits():
+    lines = ['aaa', 'bbb', 'ccc', 'd' * 20, 'e']
+    assert _split_chunks_by_chars(lines, chunk_size=8, max_lines=10) == [(0, 2), (2, 3), (3, 4), (4, 5)]
+    assert _split_chunks_by_chars(lines, chunk_size=600, max_lines=2) == [(0, 2), (2, 4), (4, 5)]
+    assert _split_chunks_by_chars([], chunk_size=8, max_lines=10) == []
+
+
+def test_split_chunks_by_chars_matches_greedy_loop():
+    rng = random.Random(3)
+    for _ in range(5000):
+        lines = ['x' * rng.randint(0, 30) for _ in range(rng.randint(0, 30))]
+        chunk_size = rng.choice([0, 1, 5, 20, 60, 600])
+        max_lines = rng.choice([0, 1, 2, 5, 10])
+        expected = _greedy_chunks(lines, chunk_size=chunk_size, max_lines=max_lines)
+        assert _split_chunks_by_chars(lines, chunk_size=chunk_size, max_lines=max_lines) == expected
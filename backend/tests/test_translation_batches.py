@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+engine = pytest.importorskip('videolingo_subtitle_core.engine')
+
+_build_translation_batches = engine._build_translation_batches
+
+
+def _greedy_batches(texts, *, max_items, max_chars, min_items):
+    if not texts:
+        return []
+    total = len(texts)
+    max_items = max(1, int(max_items))
+    max_chars = max(1, int(max_chars))
+    min_items = max(1, min(int(min_items), max_items))
+    batches = []
+    cursor = 0
+    while cursor < total:
+        start = cursor
+        chars_in_batch = 0
+        while cursor < total:
+            item_chars = len(str(texts[cursor] or ''))
+            current_count = cursor - start
+            if current_count + 1 > max_items:
+                break
+            if chars_in_batch + item_chars > max_chars and current_count >= min_items:
+                break
+            chars_in_batch += item_chars
+            cursor += 1
+        if cursor == start:
+            cursor += 1
+        batches.append((start, cursor))
+    return batches
+
+
+def test_build_translation_batches_limits():
+    texts = ['a' * 4, 'b' * 4, 'c' * 4, 'd' * 20, 'e']
+    assert _build_translation_batches(texts, max_items=10, max_chars=8, min_items=1) == [(0, 2), (2, 3), (3, 4), (4, 5)]
+    assert _build_translation_batches(texts, max_items=2, max_chars=100, min_items=1) == [(0, 2), (2, 4), (4, 5)]
+    assert _build_translation_batches(texts, max_items=10, max_chars=1, min_items=2) == [(0, 2), (2, 4), (4, 5)]
+    assert _build_translation_batches([], max_items=10, max_chars=8, min_items=1) == []
+
+
+def test_build_translation_batches_matches_greedy_loop():
+    rng = random.Random(7)
+    for _ in range(2000):
+        texts = ['x' * rng.randint(0, 40) for _ in range(rng.randint(0, 30))]
+        kwargs = {
+            'max_items': rng.choice([0, 1, 2, 5, 12, 40]),
+            'max_chars': rng.choice([0, 1, 10, 60, 200, 5000]),
+            'min_items': rng.choice([0, 1, 2, 4, 50]),
+        }
+        assert _build_translation_batches(texts, **kwargs) == _greedy_batches(texts, **kwargs)
@@ -1,7 +1,8 @@
 ﻿"""Shared package for Listening V2 services."""
 
 from .config import Settings, get_settings
-from .db import Base, SessionLocal, engine, init_db
+from . import db as _db
+from .db import Base, get_engine, get_session_factory, init_db
 
 __all__ = [
     "Settings",
@@ -10,4 +11,12 @@ __all__ = [
     "SessionLocal",
     "engine",
     "init_db",
+    "get_engine",
+    "get_session_factory",
 ]
+
+
+def __getattr__(name: str):
+    if name in {"SessionLocal", "engine"}:
+        return getattr(_db, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
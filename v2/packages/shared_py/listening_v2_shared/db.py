@@ -1,19 +1,79 @@
-﻿from sqlalchemy import create_engine
+﻿import os
+import threading
+from typing import Any
+
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
-from .config import get_settings
+from .config import Settings, get_settings
 
 
 class Base(DeclarativeBase):
     pass
 
 
-settings = get_settings()
-engine = create_engine(settings.database_url, future=True, pool_pre_ping=True)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+_ENGINE_LOCK = threading.Lock()
+
+
+def _engine_options(settings: Settings) -> dict:
+    options = {'future': True, 'pool_pre_ping': True}
+    if settings.database_url.startswith('sqlite'):
+        return options
+    options.update(
+        pool_size=max(1, settings.db_pool_size),
+        max_overflow=max(0, settings.db_max_overflow),
+        pool_recycle=settings.db_pool_recycle_seconds,
+    )
+    if settings.database_url.startswith('postgresql'):
+        options['connect_args'] = {'application_name': settings.app_name}
+    return options
+
+
+def get_engine() -> Engine:
+    engine = globals().get('engine')
+    if engine is None:
+        with _ENGINE_LOCK:
+            engine = globals().get('engine')
+            if engine is None:
+                settings = get_settings()
+                engine = create_engine(settings.database_url, **_engine_options(settings))
+                globals()['engine'] = engine
+    return engine
+
+
+def get_session_factory() -> sessionmaker:
+    factory = globals().get('SessionLocal')
+    if factory is None:
+        engine = get_engine()
+        with _ENGINE_LOCK:
+            factory = globals().get('SessionLocal')
+            if factory is None:
+                factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+                globals()['SessionLocal'] = factory
+    return factory
+
+
+def __getattr__(name: str) -> Any:
+    if name == 'engine':
+        return get_engine()
+    if name == 'SessionLocal':
+        return get_session_factory()
+    if name == 'settings':
+        return get_settings()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def _dispose_engine_after_fork() -> None:
+    engine = globals().get('engine')
+    if engine is not None:
+        engine.dispose(close=False)
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_dispose_engine_after_fork)
 
 
 def init_db() -> None:
     from . import models  # noqa: F401
 
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
@@ -1,8 +1,14 @@
 ﻿from __future__ import annotations
 
-from sqlalchemy import select
+import threading
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
+from .config import get_settings
 from .models import ModelRoute
 
 
@@ -13,20 +19,84 @@ DEFAULT_ROUTES = [
 ]
 
 
+@dataclass(frozen=True, slots=True)
+class ModelRouteSnapshot:
+    model_name: str
+    enabled: bool
+    cost_per_unit: float
+    multiplier: float
+
+
+_ROUTE_CACHE: dict[str, tuple[float, ModelRouteSnapshot]] = {}
+_ROUTE_CACHE_LOCK = threading.Lock()
+_ROUTE_CACHE_GENERATION = 0
+
+
+def invalidate_route_cache(model_name: str | None = None) -> None:
+    global _ROUTE_CACHE_GENERATION
+    with _ROUTE_CACHE_LOCK:
+        _ROUTE_CACHE_GENERATION += 1
+        if model_name is None:
+            _ROUTE_CACHE.clear()
+        else:
+            _ROUTE_CACHE.pop(model_name, None)
+
+
+def invalidate_route_cache_on_commit(db: Session) -> None:
+    event.listen(db, 'after_commit', lambda _session: invalidate_route_cache(), once=True)
+
+
 def ensure_default_model_routes(db: Session) -> None:
-    existing = {row.model_name for row in db.execute(select(ModelRoute)).scalars().all()}
-    for row in DEFAULT_ROUTES:
-        if row['model_name'] in existing:
-            continue
-        db.add(ModelRoute(**row))
+    db.execute(pg_insert(ModelRoute).values(DEFAULT_ROUTES).on_conflict_do_nothing(index_elements=[ModelRoute.model_name]))
     db.commit()
 
 
-def get_model_route(db: Session, model_name: str) -> ModelRoute:
-    row = db.get(ModelRoute, model_name)
+def upsert_model_routes(db: Session, rows: list[dict]) -> list[ModelRoute]:
+    by_name = {row['model_name']: row for row in rows}
+    if not by_name:
+        return []
+    stmt = pg_insert(ModelRoute).values(list(by_name.values()))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ModelRoute.model_name],
+        set_={
+            'enabled': stmt.excluded.enabled,
+            'cost_per_unit': stmt.excluded.cost_per_unit,
+            'multiplier': stmt.excluded.multiplier,
+            'updated_at': stmt.excluded.updated_at,
+        },
+    )
+    returned = {
+        row.model_name: row
+        for row in db.scalars(stmt.returning(ModelRoute), execution_options={'populate_existing': True})
+    }
+    invalidate_route_cache_on_commit(db)
+    return [returned[name] for name in by_name]
+
+
+def get_model_route(db: Session, model_name: str, *, use_cache: bool = True) -> ModelRouteSnapshot:
+    now = time.monotonic()
+    with _ROUTE_CACHE_LOCK:
+        cached = _ROUTE_CACHE.get(model_name)
+        generation = _ROUTE_CACHE_GENERATION
+    if use_cache and cached is not None and cached[0] > now:
+        return cached[1]
+
+    row = db.get(ModelRoute, model_name, populate_existing=True)
     if row is None:
-        row = ModelRoute(model_name=model_name, enabled=True, cost_per_unit=0.0, multiplier=1.0)
-        db.add(row)
+        db.execute(
+            pg_insert(ModelRoute)
+            .values(model_name=model_name, enabled=True, cost_per_unit=0.0, multiplier=1.0)
+            .on_conflict_do_nothing(index_elements=[ModelRoute.model_name])
+        )
         db.commit()
-        db.refresh(row)
-    return row
+        row = db.get(ModelRoute, model_name)
+    snapshot = ModelRouteSnapshot(
+        model_name=row.model_name,
+        enabled=bool(row.enabled),
+        cost_per_unit=float(row.cost_per_unit),
+        multiplier=float(row.multiplier),
+    )
+    with _ROUTE_CACHE_LOCK:
+        if generation == _ROUTE_CACHE_GENERATION:
+            _ROUTE_CACHE[model_name] = (now + get_settings().model_route_cache_seconds, snapshot)
+    return snapshot
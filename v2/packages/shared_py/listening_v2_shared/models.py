@@ -114,6 +114,13 @@ class ProcessingJob(Base):
     updated_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=utcnow, onupdate=utcnow, nullable=False)
     completed_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
+    asr_segments: Mapped[list[AsrSegment]] = relationship(
+        back_populates='job',
+        lazy='raise',
+        passive_deletes=True,
+        order_by='AsrSegment.segment_index',
+    )
+
 
 class AsrSegment(Base):
     __tablename__ = 'asr_segments'
@@ -128,6 +135,8 @@ class AsrSegment(Base):
     needs_review: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     created_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=utcnow, nullable=False)
 
+    job: Mapped[ProcessingJob] = relationship(back_populates='asr_segments', lazy='raise')
+
     __table_args__ = (UniqueConstraint('job_id', 'segment_index', name='uq_asr_segment_job_index'),)
 
 
@@ -142,6 +151,13 @@ class ExerciseSet(Base):
     target_lang: Mapped[str] = mapped_column(String(8), nullable=False, default='zh')
     created_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=utcnow, nullable=False)
 
+    items: Mapped[list[ExerciseItem]] = relationship(
+        back_populates='exercise_set',
+        lazy='raise',
+        passive_deletes=True,
+        order_by='ExerciseItem.segment_index',
+    )
+
 
 class ExerciseItem(Base):
     __tablename__ = 'exercise_items'
@@ -159,6 +175,8 @@ class ExerciseItem(Base):
     accepted_json: Mapped[list] = mapped_column(JSONB, nullable=False, default=list)
     created_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=utcnow, nullable=False)
 
+    exercise_set: Mapped[ExerciseSet] = relationship(back_populates='items', lazy='raise')
+
     __table_args__ = (UniqueConstraint('exercise_set_id', 'segment_index', name='uq_exercise_item_set_index'),)
 
 
@@ -200,3 +218,27 @@ class DeletionRequest(Base):
 
 Index('idx_processing_jobs_user_created', ProcessingJob.user_id, ProcessingJob.created_at.desc())
 Index('idx_wallet_ledger_user_created', WalletLedger.user_id, WalletLedger.created_at.desc())
+Index(
+    'idx_wallet_ledger_metadata_gin',
+    WalletLedger.metadata_json,
+    postgresql_using='gin',
+    postgresql_ops={'metadata_json': 'jsonb_path_ops'},
+)
+Index(
+    'idx_exercise_items_words_gin',
+    ExerciseItem.words_json,
+    postgresql_using='gin',
+    postgresql_ops={'words_json': 'jsonb_path_ops'},
+)
+Index(
+    'idx_exercise_items_accepted_gin',
+    ExerciseItem.accepted_json,
+    postgresql_using='gin',
+    postgresql_ops={'accepted_json': 'jsonb_path_ops'},
+)
+Index(
+    'idx_exercise_attempts_submitted_words_gin',
+    ExerciseAttempt.submitted_words_json,
+    postgresql_using='gin',
+    postgresql_ops={'submitted_words_json': 'jsonb_path_ops'},
+)
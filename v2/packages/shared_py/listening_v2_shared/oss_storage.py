@@ -1,6 +1,7 @@
 ﻿from __future__ import annotations
 
 import datetime as dt
+import functools
 import uuid
 from pathlib import Path
 
@@ -9,8 +10,10 @@ import oss2
 from .config import get_settings
 
 settings = get_settings()
+_PUBLIC_URL_BASE = f"https://{settings.oss_bucket}.{settings.oss_endpoint.replace('https://', '').replace('http://', '')}"
 
 
+@functools.lru_cache(maxsize=1)
 def _build_bucket() -> oss2.Bucket | None:
     if not (settings.oss_access_key_id and settings.oss_access_key_secret and settings.oss_bucket and settings.oss_endpoint):
         return None
@@ -21,6 +24,10 @@ def _build_bucket() -> oss2.Bucket | None:
     return oss2.Bucket(auth, endpoint, settings.oss_bucket)
 
 
+def _reset_bucket() -> None:
+    _build_bucket.cache_clear()
+
+
 def upload_file(local_path: str, object_prefix: str = 'media') -> str:
     bucket = _build_bucket()
     if bucket is None:
@@ -43,6 +50,4 @@ def delete_object(object_key: str) -> None:
 def public_url(object_key: str) -> str:
     if not object_key:
         return ''
-    endpoint = settings.oss_endpoint
-    endpoint = endpoint.replace('https://', '').replace('http://', '')
-    return f'https://{settings.oss_bucket}.{endpoint}/{object_key}'
+    return f'{_PUBLIC_URL_BASE}/{object_key}'
@@ -1,22 +1,26 @@
 ﻿from __future__ import annotations
 
-import math
-from decimal import Decimal
+MICRO_CREDITS = 1_000_000
+_MILLI = 1_000
 
 DEFAULT_MODEL_PRICING = {
-    'paraformer-v2': {'unit': 'second', 'cost_per_unit': Decimal('0.25')},
-    'qwen3-asr-flash': {'unit': 'second', 'cost_per_unit': Decimal('0.35')},
-    'qwen-mt': {'unit': 'segment', 'cost_per_unit': Decimal('2.0')},
+    'paraformer-v2': {'unit': 'second', 'cost_per_unit_micro': 250_000},
+    'qwen3-asr-flash': {'unit': 'second', 'cost_per_unit_micro': 350_000},
+    'qwen-mt': {'unit': 'segment', 'cost_per_unit_micro': 2_000_000},
 }
 
 
+def _to_milli(value: float) -> int:
+    return max(0, round(float(value or 0.0) * _MILLI))
+
+
 def calculate_job_cost_credits(*, duration_seconds: float, segment_count: int, asr_model: str, mt_model: str, asr_multiplier: float = 1.0, mt_multiplier: float = 1.0) -> int:
-    duration = max(0.0, float(duration_seconds or 0.0))
+    duration_milli = _to_milli(duration_seconds)
     segs = max(0, int(segment_count or 0))
 
-    asr_price = DEFAULT_MODEL_PRICING.get(asr_model, DEFAULT_MODEL_PRICING['paraformer-v2'])['cost_per_unit']
-    mt_price = DEFAULT_MODEL_PRICING.get(mt_model, DEFAULT_MODEL_PRICING['qwen-mt'])['cost_per_unit']
+    asr_price = DEFAULT_MODEL_PRICING.get(asr_model, DEFAULT_MODEL_PRICING['paraformer-v2'])['cost_per_unit_micro']
+    mt_price = DEFAULT_MODEL_PRICING.get(mt_model, DEFAULT_MODEL_PRICING['qwen-mt'])['cost_per_unit_micro']
 
-    asr_cost = Decimal(str(duration)) * asr_price * Decimal(str(max(0.0, asr_multiplier)))
-    mt_cost = Decimal(str(segs)) * mt_price * Decimal(str(max(0.0, mt_multiplier)))
-    return int(math.ceil(float(asr_cost + mt_cost)))
+    asr_cost = duration_milli * asr_price * _to_milli(asr_multiplier)
+    mt_cost = segs * _MILLI * mt_price * _to_milli(mt_multiplier)
+    return -(-(asr_cost + mt_cost) // (_MILLI * MICRO_CREDITS * _MILLI))
@@ -10,11 +10,12 @@ from fastapi import Depends, FastAPI, HTTPException, Request, Response
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel, Field
 from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from listening_v2_shared.config import get_settings
 from listening_v2_shared.db import SessionLocal, init_db
-from listening_v2_shared.model_routes import ensure_default_model_routes
+from listening_v2_shared.model_routes import ensure_default_model_routes, upsert_model_routes
 from listening_v2_shared.models import ModelRoute, RedeemCode
 
 settings = get_settings()
@@ -110,34 +111,42 @@ def index():
 def create_codes(payload: CreateCodesPayload, request: Request, _: None = Depends(require_admin), db: Session = Depends(get_db)):
     alphabet = string.ascii_uppercase + string.digits
     expires_at = dt.datetime.now(dt.timezone.utc) + dt.timedelta(days=payload.expires_days)
-    codes: list[str] = []
+    prefix = payload.prefix.upper()[:6]
+    codes: set[str] = set()
     while len(codes) < payload.count:
-        body = ''.join(secrets.choice(alphabet) for _ in range(12))
-        code = f"{payload.prefix.upper()[:6]}{body}"
-        if db.get(RedeemCode, code):
-            continue
-        db.add(RedeemCode(code=code, credits=payload.credits, status='active', created_by='admin', expires_at=expires_at))
-        codes.append(code)
-    db.flush()
-    return {'requestId': uuid.uuid4().hex, 'code': 'ok', 'message': 'created', 'data': {'codes': codes, 'count': len(codes)}}
+        candidates: set[str] = set()
+        while len(candidates) < payload.count - len(codes):
+            code = f"{prefix}{''.join(secrets.choice(alphabet) for _ in range(12))}"
+            if code not in codes:
+                candidates.add(code)
+        existing = set(db.scalars(select(RedeemCode.code).where(RedeemCode.code.in_(candidates))).all())
+        codes.update(candidates - existing)
+    created = sorted(codes)
+    db.execute(
+        insert(RedeemCode),
+        [
+            {'code': code, 'credits': payload.credits, 'status': 'active', 'created_by': 'admin', 'expires_at': expires_at}
+            for code in created
+        ],
+    )
+    return {'requestId': uuid.uuid4().hex, 'code': 'ok', 'message': 'created', 'data': {'codes': created, 'count': len(created)}}
 
 
 @app.patch('/api/v2/admin/model-routes')
 def patch_routes(payload: PatchRoutesPayload, request: Request, _: None = Depends(require_admin), db: Session = Depends(get_db)):
     ensure_default_model_routes(db)
     now = dt.datetime.now(dt.timezone.utc)
-    out: list[dict] = []
-    for item in payload.items:
-        row = db.get(ModelRoute, item.model_name)
-        if row is None:
-            row = ModelRoute(model_name=item.model_name)
-            db.add(row)
-        row.enabled = item.enabled
-        row.cost_per_unit = item.cost_per_unit
-        row.multiplier = item.multiplier
-        row.updated_at = now
-        out.append({'modelName': row.model_name, 'enabled': row.enabled, 'costPerUnit': float(row.cost_per_unit), 'multiplier': float(row.multiplier)})
-    db.flush()
+    rows = upsert_model_routes(
+        db,
+        [
+            {'model_name': item.model_name, 'enabled': item.enabled, 'cost_per_unit': item.cost_per_unit, 'multiplier': item.multiplier, 'updated_at': now}
+            for item in payload.items
+        ],
+    )
+    out = [
+        {'modelName': row.model_name, 'enabled': row.enabled, 'costPerUnit': float(row.cost_per_unit), 'multiplier': float(row.multiplier)}
+        for row in rows
+    ]
     return {'requestId': uuid.uuid4().hex, 'code': 'ok', 'message': 'patched', 'data': {'items': out}}
 
 
@@ -0,0 +1,35 @@
+﻿"""jsonb gin indexes
+
+Revision ID: 0002_jsonb_gin_indexes
+Revises: 0001_initial
+Create Date: 2026-10-16 00:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '0002_jsonb_gin_indexes'
+down_revision = '0001_initial'
+branch_labels = None
+depends_on = None
+
+GIN_INDEXES = (
+    ('idx_wallet_ledger_metadata_gin', 'wallet_ledger', 'metadata_json'),
+    ('idx_exercise_items_words_gin', 'exercise_items', 'words_json'),
+    ('idx_exercise_items_accepted_gin', 'exercise_items', 'accepted_json'),
+    ('idx_exercise_attempts_submitted_words_gin', 'exercise_attempts', 'submitted_words_json'),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in GIN_INDEXES:
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} USING gin ({column} jsonb_path_ops)')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in GIN_INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
@@ -2,6 +2,7 @@
 
 from fastapi import HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from listening_v2_shared.models import Session as UserSession
@@ -29,13 +30,16 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = auth_scheme) ->
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='invalid_token')
 
     with session_scope() as db:
-        user = db.get(User, user_id)
-        if user is None:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='user_not_found')
-        session_row = db.query(UserSession).filter(UserSession.token_jti == jti, UserSession.user_id == user_id, UserSession.revoked_at.is_(None)).first()
-        if session_row is None:
+        row = db.execute(
+            select(User)
+            .join(UserSession, UserSession.user_id == User.id)
+            .where(User.id == user_id, UserSession.token_jti == jti, UserSession.revoked_at.is_(None))
+        ).first()
+        if row is None:
+            if db.get(User, user_id) is None:
+                raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='user_not_found')
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='session_revoked')
-        return user
+        return row.User
 
 
 def require_admin(request: Request) -> None:
@@ -5,7 +5,7 @@ from pathlib import Path
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import FileResponse
-from sqlalchemy import asc
+from sqlalchemy.orm import raiseload, selectinload
 
 from listening_v2_shared.models import ExerciseAttempt, ExerciseItem, ExerciseSet, LearningProgress, User
 from listening_v2_shared.oss_storage import public_url
@@ -25,17 +25,10 @@ def _normalize_words(words: list[str]) -> list[str]:
 @router.get('/{exercise_id}')
 def get_exercise(exercise_id: str, request: Request, user: User = Depends(get_current_user)):
     with session_scope() as db:
-        exercise = db.get(ExerciseSet, exercise_id)
+        exercise = db.get(ExerciseSet, exercise_id, options=[selectinload(ExerciseSet.items), raiseload('*')])
         if exercise is None or exercise.user_id != user.id:
             raise HTTPException(status_code=404, detail='exercise_not_found')
 
-        items = (
-            db.query(ExerciseItem)
-            .filter(ExerciseItem.exercise_set_id == exercise_id)
-            .order_by(asc(ExerciseItem.segment_index))
-            .all()
-        )
-
         progress = (
             db.query(LearningProgress)
             .filter(LearningProgress.user_id == user.id, LearningProgress.exercise_set_id == exercise_id)
@@ -65,7 +58,7 @@ def get_exercise(exercise_id: str, request: Request, user: User = Depends(get_cu
                         'wordCount': len(item.words_json or []),
                         'audioUrl': public_url(item.audio_clip_key) if item.audio_clip_key else f'/api/v2/exercises/items/{item.id}/audio',
                     }
-                    for item in items
+                    for item in exercise.items
                 ],
             },
         )
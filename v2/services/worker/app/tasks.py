@@ -197,8 +197,8 @@ def run_pipeline(job_id: str) -> None:
         if duration > settings.max_video_minutes * 60:
             raise RuntimeError('video_too_long')
 
-        asr_route = get_model_route(db, job.model_asr)
-        mt_route = get_model_route(db, job.model_mt)
+        asr_route = get_model_route(db, job.model_asr, use_cache=False)
+        mt_route = get_model_route(db, job.model_mt, use_cache=False)
         if not bool(asr_route.enabled):
             raise RuntimeError('asr_model_disabled')
         if not bool(mt_route.enabled):
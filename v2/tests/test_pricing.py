@@ -42,3 +42,38 @@ def test_calculate_job_cost_credits_multiplier():
         mt_multiplier=2.0,
     )
     assert high >= normal
+
+
+def test_calculate_job_cost_credits_fractional_duration():
+    cost = calculate_job_cost_credits(
+        duration_seconds=1.5,
+        segment_count=0,
+        asr_model='paraformer-v2',
+        mt_model='qwen-mt',
+    )
+    assert cost == 1
+
+
+def test_calculate_job_cost_credits_fractional_multipliers():
+    cost = calculate_job_cost_credits(
+        duration_seconds=10.5,
+        segment_count=3,
+        asr_model='paraformer-v2',
+        mt_model='qwen-mt',
+        asr_multiplier=1.5,
+        mt_multiplier=1.25,
+    )
+    assert cost == 12
+
+
+def test_calculate_job_cost_credits_ceil_boundary():
+    kwargs = dict(segment_count=0, asr_model='paraformer-v2', mt_model='qwen-mt', asr_multiplier=1.5)
+    assert calculate_job_cost_credits(duration_seconds=8, **kwargs) == 3
+    assert calculate_job_cost_credits(duration_seconds=8.004, **kwargs) == 4
+
+
+def test_calculate_job_cost_credits_duration_rounds_to_milliseconds():
+    kwargs = dict(segment_count=0, asr_model='paraformer-v2', mt_model='qwen-mt')
+    assert calculate_job_cost_credits(duration_seconds=4.0, **kwargs) == 1
+    assert calculate_job_cost_credits(duration_seconds=4.0001, **kwargs) == 1
+    assert calculate_job_cost_credits(duration_seconds=4.001, **kwargs) == 2